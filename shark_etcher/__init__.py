@@ -3,6 +3,7 @@
 __all__ = [
     "devices",
     "imaging",
+    "ipc",
     "ui",
     "__version__",
 ]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import ctypes
+import functools
 import json
 import os
 import platform
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Sequence
 
@@ -29,6 +32,11 @@ class DeviceEnumerationError(RuntimeError):
     pass
 
 
+# Helper tools resolved once; shutil.which stats every PATH entry per call.
+_UDISKSCTL = shutil.which("udisksctl")
+_FINDMNT = shutil.which("findmnt")
+
+
 class UnmountError(RuntimeError):
     """Raised when automatic unmounting fails."""
 
@@ -59,15 +67,19 @@ def unmount_device(device: BlockDevice) -> List[str]:
     if not targets:
         return []
 
+    sources = _read_mount_sources()
     unmounted: List[str] = []
     errors: List[str] = []
 
     for target in targets:
-        if _unmount_target(target):
+        if _unmount_target(target, source=sources.get(target)):
             unmounted.append(target)
         else:
             errors.append(target)
 
+    if unmounted:
+        invalidate_device_cache()
+
     if errors:
         details = ", ".join(errors)
         raise UnmountError(f"Failed to unmount: {details}", partial=unmounted)
@@ -75,14 +87,68 @@ def unmount_device(device: BlockDevice) -> List[str]:
     return unmounted
 
 
-def _unmount_target(target: str) -> bool:
+_libc: Optional[ctypes.CDLL] = None
+_libc_loaded = False
+
+
+def _umount_syscall(target: str) -> bool:
+    """Call umount2(2) directly, skipping a fork+exec of /bin/umount."""
+    global _libc, _libc_loaded
+    if not _libc_loaded:
+        _libc_loaded = True
+        try:
+            _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        except OSError:
+            _libc = None
+    if _libc is None:
+        return False
+    try:
+        return _libc.umount2(os.fsencode(target), 0) == 0
+    except (AttributeError, ctypes.ArgumentError):
+        return False
+
+
+def _read_mount_sources() -> dict:
+    """Map mountpoint -> source device from /proc/self/mountinfo in one pass."""
+    sources: dict = {}
+    try:
+        with open("/proc/self/mountinfo", "r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                fields = line.split()
+                try:
+                    separator = fields.index("-")
+                except ValueError:
+                    continue
+                if len(fields) < 5 or len(fields) <= separator + 2:
+                    continue
+                sources[_decode_mount_path(fields[4])] = _decode_mount_path(fields[separator + 2])
+    except OSError:
+        pass
+    return sources
+
+
+def _decode_mount_path(value: str) -> str:
+    # mountinfo octal-escapes space, tab, newline and backslash.
+    return (
+        value.replace("\\040", " ")
+        .replace("\\011", "\t")
+        .replace("\\012", "\n")
+        .replace("\\134", "\\")
+    )
+
+
+def _unmount_target(target: str, source: Optional[str] = None) -> bool:
+    if _umount_syscall(target):
+        return True
+
     candidates = [
         ["umount", target],
     ]
 
-    source = _lookup_mount_source(target)
-    if source and shutil.which("udisksctl"):
-        candidates.append(["udisksctl", "unmount", "-b", source])
+    if source is None:
+        source = _lookup_mount_source(target)
+    if source and _UDISKSCTL:
+        candidates.append([_UDISKSCTL, "unmount", "-b", source])
 
     candidates.append(["umount", "-l", target])
 
@@ -104,9 +170,11 @@ def _unmount_target(target: str) -> bool:
 
 
 def _lookup_mount_source(target: str) -> Optional[str]:
+    if not _FINDMNT:
+        return None
     try:
         completed = subprocess.run(
-            ["findmnt", "-no", "SOURCE", "--", target],
+            [_FINDMNT, "-no", "SOURCE", "--", target],
             check=True,
             capture_output=True,
             text=True,
@@ -117,21 +185,39 @@ def _lookup_mount_source(target: str) -> Optional[str]:
     return value or None
 
 
+# Enumeration forks lsblk and parses JSON; a short TTL keeps repeated lookups
+# (progress polling, find_device_by_path) from re-spawning it.
+_CACHE_TTL = 1.0
+_device_cache: Optional[tuple] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _system() -> str:
+    return platform.system()
+
+
+def invalidate_device_cache() -> None:
+    """Drop the cached enumeration, e.g. after mounts changed."""
+    global _device_cache
+    _device_cache = None
+
+
 def list_block_devices(require_removable: bool = True) -> List[BlockDevice]:
-    system = platform.system()
-    if system == "Linux":
-        devices = _linux_devices()
-    elif system == "Darwin":
-        devices = _darwin_devices()
-    elif system == "Windows":
-        devices = _windows_devices()
+    global _device_cache
+    now = time.monotonic()
+    if _device_cache is not None and now - _device_cache[0] < _CACHE_TTL:
+        devices = _device_cache[1]
     else:
-        raise DeviceEnumerationError(f"Unsupported platform: {system}")
+        enumerator = _ENUMERATORS.get(_system())
+        if enumerator is None:
+            raise DeviceEnumerationError(f"Unsupported platform: {_system()}")
+        devices = enumerator()
+        _device_cache = (now, devices)
 
     if require_removable:
-        devices = [d for d in devices if d.removable]
+        return [d for d in devices if d.removable]
 
-    return devices
+    return list(devices)
 
 
 def _linux_devices() -> List[BlockDevice]:
@@ -190,18 +276,19 @@ def _linux_devices() -> List[BlockDevice]:
     return devices
 
 
-def _collect_mountpoints(node: dict) -> Iterable[str]:
-    mountpoints: List[str] = []
-    mp = node.get("mountpoint")
-    if mp:
-        mountpoints.append(mp)
-    list_mp = node.get("mountpoints") or []
-    for item in list_mp:
-        if item:
-            mountpoints.append(item)
-    for child in node.get("children", []) or []:
-        mountpoints.extend(_collect_mountpoints(child))
-    return {m for m in mountpoints if m}
+def _collect_mountpoints(node: dict) -> set[str]:
+    mountpoints: set[str] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        mp = current.get("mountpoint")
+        if mp:
+            mountpoints.add(mp)
+        for item in current.get("mountpoints") or ():
+            if item:
+                mountpoints.add(item)
+        stack.extend(current.get("children") or ())
+    return mountpoints
 
 
 def _format_description(name: str, size_bytes: int, model: str, transport: Optional[str]) -> str:
@@ -212,17 +299,14 @@ def _format_description(name: str, size_bytes: int, model: str, transport: Optio
     return f"{name} - {size_text} - {label}"
 
 
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
 def _format_size(size_bytes: int) -> str:
     if size_bytes <= 0:
         return "Unknown"
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
-    value = float(size_bytes)
-    unit = units[0]
-    for unit in units:
-        if value < 1024.0:
-            break
-        value /= 1024.0
-    return f"{value:.1f} {unit}"
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def _darwin_devices() -> List[BlockDevice]:
@@ -231,3 +315,12 @@ def _darwin_devices() -> List[BlockDevice]:
 
 def _windows_devices() -> List[BlockDevice]:
     raise DeviceEnumerationError("Windows support not implemented yet")
+
+
+# Resolved once per lookup via the memoized platform name; adding a platform
+# means adding an enumerator here.
+_ENUMERATORS = {
+    "Linux": _linux_devices,
+    "Darwin": _darwin_devices,
+    "Windows": _windows_devices,
+}
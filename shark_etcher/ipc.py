@@ -0,0 +1,90 @@
+"""Compact framing for the worker's high-frequency progress events.
+
+Rare events (status/log/done/error) stay newline-delimited JSON on the worker
+pipe. Progress can fire many times per second, so it uses a fixed-size binary
+frame instead, sparing both processes a JSON encode/decode and the resulting
+dict/str churn per tick.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+# Frame layout: the marker byte, then phase, current and total as
+# little-endian unsigned integers (total 0 means unknown). Anything on the
+# pipe not starting with the marker is a JSON line.
+PROGRESS_MARKER = b"P"
+_PROGRESS_STRUCT = struct.Struct("<BQQ")
+
+PHASE_WRITE = 0
+PHASE_VERIFY = 1
+
+
+def pack_progress(phase: int, current: int, total: Optional[int]) -> bytes:
+    return PROGRESS_MARKER + _PROGRESS_STRUCT.pack(phase, current, total or 0)
+
+
+def unpack_progress(payload: bytes) -> Tuple[int, int, Optional[int]]:
+    phase, current, total = _PROGRESS_STRUCT.unpack(payload)
+    return phase, current, total if total else None
+
+
+def read_events(stream: BinaryIO) -> Iterator[Union[Tuple[int, int, Optional[int]], bytes]]:
+    """Yield events from a worker pipe opened in binary mode.
+
+    Progress frames are yielded as ``(phase, current, total)`` tuples; every
+    other line comes out as raw bytes for the caller to parse as JSON.
+    """
+    read = stream.read
+    frame_size = _PROGRESS_STRUCT.size
+    while True:
+        marker = read(1)
+        if not marker:
+            return
+        if marker == PROGRESS_MARKER:
+            payload = read(frame_size)
+            if len(payload) < frame_size:
+                return
+            yield unpack_progress(payload)
+        else:
+            line = marker + stream.readline()
+            if line.strip():
+                yield line
+
+
+class EventParser:
+    """Incremental counterpart to :func:`read_events` for non-blocking reads.
+
+    Feed it whatever ``os.read`` returned and it hands back the events that
+    are complete so far, buffering partial frames and lines until the next
+    chunk arrives.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Union[Tuple[int, int, Optional[int]], bytes]]:
+        buffer = self._buffer
+        buffer += data
+        events: List[Union[Tuple[int, int, Optional[int]], bytes]] = []
+        frame_size = 1 + _PROGRESS_STRUCT.size
+        marker = PROGRESS_MARKER[0]
+        pos = 0
+        end = len(buffer)
+        while pos < end:
+            if buffer[pos] == marker:
+                if end - pos < frame_size:
+                    break
+                events.append(unpack_progress(bytes(buffer[pos + 1:pos + frame_size])))
+                pos += frame_size
+            else:
+                newline = buffer.find(b"\n", pos)
+                if newline < 0:
+                    break
+                line = bytes(buffer[pos:newline + 1])
+                if line.strip():
+                    events.append(line)
+                pos = newline + 1
+        del buffer[:pos]
+        return events
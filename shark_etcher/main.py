@@ -7,6 +7,7 @@ import shutil
 import subprocess
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -19,19 +20,40 @@ from .devices import (
     list_block_devices,
     unmount_device,
 )
-from .imaging import FlashError, VerificationError, flash_image
+from .imaging import FlashError, VerificationError, flash_image, recommended_chunk_size
+from .ipc import PHASE_VERIFY, PHASE_WRITE, pack_progress, read_events
+
+
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
 
 
 def _format_size(value: int) -> str:
     if value <= 0:
         return "0 B"
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
-    size = float(value)
-    for unit in units:
-        if size < 1024.0:
-            break
-        size /= 1024.0
-    return f"{size:.1f} {unit}"
+    index = min((value.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{value / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+# Minimum seconds between progress reports; fast devices otherwise flood the
+# terminal (or the worker pipe) with thousands of updates.
+PROGRESS_INTERVAL = 0.1
+
+
+def _throttled(callback):
+    """Wrap a progress callback to fire at most ~10 times per second.
+
+    The final tick (current == total) always goes through so completed
+    transfers never show a stale percentage.
+    """
+    last_emit = [0.0]
+
+    def wrapper(current: int, total: Optional[int]) -> None:
+        now = time.monotonic()
+        if now - last_emit[0] >= PROGRESS_INTERVAL or current == total:
+            last_emit[0] = now
+            callback(current, total)
+
+    return wrapper
 
 
 def _progress_line(prefix: str, current: int, total: Optional[int]) -> str:
@@ -49,8 +71,15 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--device", "-d", help="destination device path (e.g. /dev/sdb)")
     parser.add_argument("--verify", action="store_true", help="verify device contents after writing")
     parser.add_argument("--dry-run", action="store_true", help="simulate the write without touching the device")
-    parser.add_argument("--chunk-size", type=int, default=4 * 1024 * 1024, help="chunk size in bytes (default 4 MiB)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="chunk size in bytes (default: picked from the device transport)",
+    )
     parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--progress-binary", action="store_true", help=argparse.SUPPRESS)
 
     args = parser.parse_args(argv)
 
@@ -90,6 +119,9 @@ def _run_cli_flash(args: argparse.Namespace) -> int:
     if not args.image or not args.device:
         raise ValueError("Missing image or device argument in CLI mode")
 
+    if args.chunk_size is None:
+        args.chunk_size = _resolve_chunk_size(args.device)
+
     needs_privileges = hasattr(os, "geteuid") and os.geteuid() != 0 and not args.dry_run
     if needs_privileges:
         return _run_cli_via_worker(args)
@@ -115,11 +147,11 @@ def _run_cli_flash(args: argparse.Namespace) -> int:
             args.device,
             verify=args.verify,
             chunk_size=args.chunk_size,
-            progress_callback=lambda current, total: _print_progress(
-                _progress_line("Writing", current, total)
+            progress_callback=_throttled(
+                lambda current, total: _print_progress(_progress_line("Writing", current, total))
             ),
-            verify_progress_callback=lambda current, total: _print_progress(
-                _progress_line("Verifying", current, total)
+            verify_progress_callback=_throttled(
+                lambda current, total: _print_progress(_progress_line("Verifying", current, total))
             ),
             status_callback=lambda message: print(message, file=sys.stderr),
             dry_run=args.dry_run,
@@ -142,6 +174,11 @@ def _run_cli_flash(args: argparse.Namespace) -> int:
     return 0
 
 
+def _resolve_chunk_size(device_path: str) -> int:
+    device_info = find_device_by_path(device_path, require_removable=False)
+    return recommended_chunk_size(device_info.transport if device_info else None)
+
+
 def _run_cli_via_worker(args: argparse.Namespace) -> int:
     if not shutil.which("pkexec"):
         print(
@@ -157,6 +194,7 @@ def _run_cli_via_worker(args: argparse.Namespace) -> int:
         python_executable,
         entrypoint,
         "--worker",
+        "--progress-binary",
         "--image",
         args.image,
         "--device",
@@ -174,7 +212,7 @@ def _run_cli_via_worker(args: argparse.Namespace) -> int:
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=65536,
             cwd=str(PROJECT_ROOT),
         )
     except FileNotFoundError as exc:
@@ -188,7 +226,7 @@ def _run_cli_via_worker(args: argparse.Namespace) -> int:
     def forward_stderr() -> None:
         assert process.stderr is not None
         for raw_line in process.stderr:
-            line = raw_line.rstrip()
+            line = raw_line.decode("utf-8", "replace").rstrip()
             if line:
                 print(f"[worker] {line}", file=sys.stderr)
 
@@ -196,25 +234,22 @@ def _run_cli_via_worker(args: argparse.Namespace) -> int:
     stderr_thread.start()
 
     assert process.stdout is not None
-    for raw_line in process.stdout:
-        line = raw_line.strip()
-        if not line:
+    for item in read_events(process.stdout):
+        if isinstance(item, tuple):
+            phase, current, total = item
+            label = "Writing" if phase == PHASE_WRITE else "Verifying"
+            _print_progress(_progress_line(label, current, total))
             continue
         try:
-            event = json.loads(line)
+            event = json.loads(item)
         except json.JSONDecodeError:
-            print(f"[worker] {line}", file=sys.stderr)
+            line = item.decode("utf-8", "replace").strip()
+            if line:
+                print(f"[worker] {line}", file=sys.stderr)
             continue
 
         kind = event.get("event")
-        if kind == "progress":
-            phase = event.get("phase")
-            current = int(event.get("current", 0))
-            total = event.get("total")
-            total_int = int(total) if isinstance(total, int) else None
-            label = "Writing" if phase == "write" else "Verifying"
-            _print_progress(_progress_line(label, current, total_int))
-        elif kind == "status":
+        if kind == "status":
             message = event.get("message", "")
             if message:
                 print(message, file=sys.stderr)
@@ -262,13 +297,105 @@ def _run_worker(args: argparse.Namespace) -> int:
         sys.stdout.write(json.dumps(message) + "\n")
         sys.stdout.flush()
 
+    if args.progress_binary:
+        stdout_buffer = sys.stdout.buffer
+
+        def make_progress(phase: int):
+            def callback(current: int, total: Optional[int]) -> None:
+                stdout_buffer.write(pack_progress(phase, current, total))
+                stdout_buffer.flush()
+
+            return callback
+
+        write_progress = make_progress(PHASE_WRITE)
+        verify_progress = make_progress(PHASE_VERIFY)
+    else:
+        def write_progress(current: int, total: Optional[int]) -> None:
+            emit("progress", phase="write", current=current, total=total)
+
+        def verify_progress(current: int, total: Optional[int]) -> None:
+            emit("progress", phase="verify", current=current, total=total)
+
+    if args.serve:
+        return _serve_worker_jobs(emit, write_progress, verify_progress)
+
     if not args.image or not args.device:
         emit("error", message="Worker missing required arguments")
         return 64
 
-    device_info = find_device_by_path(args.device, require_removable=False)
-    if device_info and device_info.mountpoints and not args.dry_run:
-        emit("status", message=f"Unmounting {args.device}")
+    return _worker_flash_job(
+        args.image,
+        args.device,
+        verify=args.verify,
+        dry_run=args.dry_run,
+        chunk_size=args.chunk_size,
+        emit=emit,
+        write_progress=write_progress,
+        verify_progress=verify_progress,
+    )
+
+
+def _serve_worker_jobs(emit, write_progress, verify_progress) -> int:
+    """Process flash jobs from stdin until a stop command or EOF.
+
+    Keeping one privileged worker alive across flashes saves an interpreter
+    start and a polkit prompt per additional drive. Jobs arrive as JSON
+    lines; each one ends with the usual done/error event, which is how the
+    caller knows the job finished.
+    """
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError:
+                emit("error", message="Malformed job request")
+                continue
+            cmd = job.get("cmd")
+            if cmd == "stop":
+                break
+            if cmd != "flash":
+                emit("error", message=f"Unknown worker command: {cmd}")
+                continue
+            image = job.get("image")
+            device = job.get("device")
+            if not image or not device:
+                emit("error", message="Job missing image or device")
+                continue
+            _worker_flash_job(
+                image,
+                device,
+                verify=bool(job.get("verify")),
+                dry_run=bool(job.get("dry_run")),
+                chunk_size=job.get("chunk_size"),
+                emit=emit,
+                write_progress=write_progress,
+                verify_progress=verify_progress,
+            )
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+def _worker_flash_job(
+    image: str,
+    device: str,
+    *,
+    verify: bool,
+    dry_run: bool,
+    chunk_size: Optional[int],
+    emit,
+    write_progress,
+    verify_progress,
+) -> int:
+    if chunk_size is None:
+        chunk_size = _resolve_chunk_size(device)
+
+    device_info = find_device_by_path(device, require_removable=False)
+    if device_info and device_info.mountpoints and not dry_run:
+        emit("status", message=f"Unmounting {device}")
         try:
             unmounted = unmount_device(device_info)
         except UnmountError as exc:
@@ -278,22 +405,18 @@ def _run_worker(args: argparse.Namespace) -> int:
             for mount in unmounted:
                 emit("log", message=f"Unmounted {mount}")
     elif device_info is None:
-        emit("log", message=f"Warning: could not refresh device info for {args.device}")
+        emit("log", message=f"Warning: could not refresh device info for {device}")
 
     try:
         written = flash_image(
-            args.image,
-            args.device,
-            verify=args.verify,
-            chunk_size=args.chunk_size,
-            progress_callback=lambda current, total: emit(
-                "progress", phase="write", current=current, total=total
-            ),
-            verify_progress_callback=lambda current, total: emit(
-                "progress", phase="verify", current=current, total=total
-            ),
+            image,
+            device,
+            verify=verify,
+            chunk_size=chunk_size,
+            progress_callback=_throttled(write_progress),
+            verify_progress_callback=_throttled(verify_progress),
             status_callback=lambda message: emit("status", message=message),
-            dry_run=args.dry_run,
+            dry_run=dry_run,
         )
     except FlashError as exc:
         emit("error", message=str(exc))
@@ -308,7 +431,7 @@ def _run_worker(args: argparse.Namespace) -> int:
         emit("error", message=f"Unexpected error: {exc}")
         return 99
 
-    emit("done", bytes_written=written, dry_run=args.dry_run)
+    emit("done", bytes_written=written, dry_run=dry_run)
     return 0
 
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import os
 import queue
+import re
+import selectors
 import shutil
 import subprocess
 import sys
@@ -11,22 +13,52 @@ import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Callable, Optional, TextIO
+from typing import Optional
+
+try:
+    # Optional C JSON parser; worker events arrive once per line and the
+    # stdlib decoder is the hottest pure-Python path in the UI process.
+    # Typed decoding (msgspec.Struct) would also drop the per-field dict
+    # lookups, but it cannot fall back to the stdlib, and since progress
+    # moved to binary frames only a handful of events per flash remain JSON.
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:
+    _json_loads = json.loads
 
 try:
     from .devices import BlockDevice, DeviceEnumerationError, list_block_devices
+    from .imaging import DEFAULT_CHUNK_SIZE, recommended_chunk_size
+    from .ipc import PHASE_WRITE, EventParser
 except ImportError:
     if __package__ in (None, ""):
         package_root = Path(__file__).resolve().parent.parent
         if str(package_root) not in sys.path:
             sys.path.insert(0, str(package_root))
         from shark_etcher.devices import BlockDevice, DeviceEnumerationError, list_block_devices  # type: ignore
+        from shark_etcher.imaging import DEFAULT_CHUNK_SIZE, recommended_chunk_size  # type: ignore
+        from shark_etcher.ipc import PHASE_WRITE, EventParser  # type: ignore
     else:
         raise
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Reschedule delays for the event-queue safety-net timer: fast while events
+# are flowing, slow while idle.
+POLL_BUSY_MS = 10
+POLL_IDLE_MS = 200
+
+# Oldest log lines are dropped beyond this, keeping the Text widget bounded
+# however chatty the worker is.
+LOG_MAX_LINES = 2000
+
+# Minimum seconds between status-label rewrites during a transfer; each
+# StringVar write fires a trace and a label redraw.
+STATUS_INTERVAL = 0.1
+
+# Pause after the last keystroke in the image-path entry before the file is
+# stat'ed for the info line.
+IMAGE_INFO_DELAY_MS = 200
 
 
 class EtcherApp(tk.Tk):
@@ -60,15 +92,39 @@ class EtcherApp(tk.Tk):
         self.dry_run_enabled = tk.BooleanVar(value=False)
 
         self.devices: list[BlockDevice] = []
+        # Treeview rows currently on screen, keyed by device path; used to
+        # patch only the rows that changed on refresh.
+        self._device_rows: dict[str, tuple] = {}
         self.selected_device: Optional[BlockDevice] = None
         self.progress_total: Optional[int] = None
+        # Mirrors the Progressbar "mode" option; reading it back through Tcl
+        # per progress event is surprisingly expensive.
+        self._progress_mode = "determinate"
+        self._last_status_ts = 0.0
+        self._last_image_path: Optional[str] = None
+        self._image_info_job: Optional[str] = None
 
         self.event_queue: queue.Queue[tuple] = queue.Queue()
-        self.flash_thread: Optional[threading.Thread] = None
+        self._refresh_pending = False
+        # The privileged worker stays alive between flashes; spawning it per
+        # job would cost an interpreter start and a polkit prompt each time.
+        self._worker_proc: Optional[subprocess.Popen] = None
+        self._worker_privileged = False
+        self._flash_active = False
+
+        # Progress is coalesced: only the newest write/verify tuple survives
+        # until the next drain, so a fast worker cannot force a redraw per
+        # chunk. Rare events (status/log/done/error) still use the queue.
+        self._progress_lock = threading.Lock()
+        self._latest_progress: Optional[tuple] = None
+        self._latest_verify: Optional[tuple] = None
 
         self._build_layout()
         self.refresh_devices()
-        self.after(100, self._poll_events)
+        # Worker threads wake the UI as events arrive; the timer below is only
+        # a low-frequency safety net, with a short reschedule while draining.
+        self.bind("<<WorkerEvent>>", lambda _event: self._drain_queue())
+        self.after(POLL_IDLE_MS, self._poll_events)
 
         self.image_path.trace_add("write", self._on_image_path_changed)
 
@@ -240,6 +296,11 @@ class EtcherApp(tk.Tk):
         palette = self.palette
         self.configure(bg=palette["bg"])
 
+        # Styles belong to the Tcl interpreter, not the widget tree; skip the
+        # few dozen configure/map round-trips if it is already themed.
+        if self.tk.call("info", "exists", "::sharkEtcherThemed"):
+            return
+
         style = ttk.Style(self)
         try:
             style.theme_use("clam")
@@ -363,43 +424,119 @@ class EtcherApp(tk.Tk):
             background=[("active", palette["accent_active"])],
         )
 
+        self.tk.call("set", "::sharkEtcherThemed", "1")
+
     def log(self, message: str) -> None:
+        self._append_log_lines([message])
+
+    def _append_log_lines(self, messages: list[str]) -> None:
+        """Insert log lines in one Text operation and trim the overflow."""
         timestamp = time.strftime("%H:%M:%S")
-        formatted = f"[{timestamp}] {message}"
-        self.log_widget.configure(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, formatted + "\n")
-        self.log_widget.see(tk.END)
-        self.log_widget.configure(state=tk.DISABLED)
+        widget = self.log_widget
+        widget.configure(state=tk.NORMAL)
+        widget.insert(tk.END, "".join(f"[{timestamp}] {message}\n" for message in messages))
+        overflow = int(widget.index("end-1c").split(".")[0]) - LOG_MAX_LINES
+        if overflow > 0:
+            widget.delete("1.0", f"{overflow + 1}.0")
+        widget.see(tk.END)
+        widget.configure(state=tk.DISABLED)
 
     def refresh_devices(self) -> None:
+        # Enumeration forks lsblk; doing that on the Tk thread freezes input.
+        # Run it in a worker and marshal the result back through the queue.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.refresh_btn.state(["disabled"])
+        threading.Thread(target=self._enumerate_devices_worker, daemon=True).start()
+
+    def _enumerate_devices_worker(self) -> None:
         try:
             devices = list_block_devices(require_removable=False)
         except DeviceEnumerationError as exc:
-            messagebox.showerror("Error", str(exc))
-            return
+            self._queue_event(("devices_error", str(exc)))
+        else:
+            self._queue_event(("devices", devices))
 
+    def _refresh_finished(self) -> None:
+        self._refresh_pending = False
+        if not self._flash_active:
+            self.refresh_btn.state(["!disabled"])
+
+    def _apply_device_list(self, devices: list[BlockDevice]) -> None:
+        self._refresh_finished()
         self.devices = devices
-        self.devices_tree.delete(*self.devices_tree.get_children())
-        for idx, device in enumerate(devices):
+
+        tree = self.devices_tree
+        new_rows: dict[str, tuple] = {}
+        for device in devices:
             mounts = ", ".join(device.mountpoints) if device.mountpoints else '--'
             tag = "removable" if device.removable else "internal"
-            self.devices_tree.insert(
-                "",
-                tk.END,
-                iid=str(idx),
-                values=(
+            new_rows[device.path] = (
+                (
                     _format_size(device.size_bytes),
                     f"{device.description}",
                     device.transport or "-",
                     mounts,
                 ),
-                tags=(tag,),
+                (tag,),
             )
 
-        self.selected_device = None
-        self.status_text.set("Select an image and a target drive")
+        # Patch only what changed so selection, focus and scroll position
+        # survive a refresh that found the same drives.
+        old_rows = self._device_rows
+        for path in old_rows.keys() - new_rows.keys():
+            tree.delete(path)
+        inserts: list[tuple] = []
+        for index, (path, (values, tags)) in enumerate(new_rows.items()):
+            old = old_rows.get(path)
+            if old is None:
+                inserts.append((index, path, values, tags))
+            elif old != (values, tags):
+                tree.item(path, values=values, tags=tags)
+        if inserts:
+            self._insert_device_rows(inserts)
+        self._device_rows = new_rows
+
+        if self.selected_device is not None and self.selected_device.path in new_rows:
+            selected_path = self.selected_device.path
+            self.selected_device = next(d for d in devices if d.path == selected_path)
+            self.status_text.set(f"Ready to write to {selected_path}")
+        else:
+            self.selected_device = None
+            self.status_text.set("Select an image and a target drive")
         self._update_flash_button_state()
 
+    def _insert_device_rows(self, rows: list[tuple]) -> None:
+        """Insert several Treeview rows in a single Tcl round-trip.
+
+        Each entry is ``(index, path, values, tags)``. A lone row goes through
+        the normal insert; batches are joined into one eval so the Tcl
+        boundary is crossed once instead of once per row.
+        """
+        if len(rows) == 1:
+            index, path, values, tags = rows[0]
+            self.devices_tree.insert("", index, iid=path, values=values, tags=tags)
+            return
+        tree_path = str(self.devices_tree)
+        script_lines = []
+        for index, path, values, tags in rows:
+            cells = " ".join(_tcl_escape(str(cell)) for cell in values)
+            script_lines.append(
+                f"{tree_path} insert {{}} {index} -id {_tcl_escape(path)}"
+                f" -values {{{cells}}} -tags {_tcl_escape(tags[0])}"
+            )
+        try:
+            self.tk.eval("\n".join(script_lines))
+        except tk.TclError:
+            # A value the escaping missed, or a partially applied script;
+            # fall back to one insert per row, skipping rows that made it in.
+            for index, path, values, tags in rows:
+                try:
+                    self.devices_tree.insert("", index, iid=path, values=values, tags=tags)
+                except tk.TclError:
+                    continue
+
     def _choose_image(self) -> None:
         file_path = filedialog.askopenfilename(
             title="Select image file",
@@ -413,19 +550,27 @@ class EtcherApp(tk.Tk):
             self._update_image_info()
 
     def _update_image_info(self) -> None:
+        self._image_info_job = None
         path_value = self.image_path.get().strip()
+        if path_value == self._last_image_path:
+            return
+        self._last_image_path = path_value
         if not path_value:
             self.image_info.set("No image selected")
             return
-        path = Path(path_value)
-        if not path.exists():
+        try:
+            size = os.stat(path_value).st_size
+        except OSError:
             self.image_info.set("Image not found")
             return
-        size_text = _format_size(path.stat().st_size)
-        self.image_info.set(f"{path.name} - {size_text}")
+        self.image_info.set(f"{Path(path_value).name} - {_format_size(size)}")
 
     def _on_image_path_changed(self, *_args: object) -> None:
-        self._update_image_info()
+        # Fires per keystroke; debounce the stat so typing a path by hand
+        # does not hit the filesystem per character.
+        if self._image_info_job is not None:
+            self.after_cancel(self._image_info_job)
+        self._image_info_job = self.after(IMAGE_INFO_DELAY_MS, self._update_image_info)
         self._update_flash_button_state()
 
     def _on_device_selected(self, _event: tk.Event) -> None:
@@ -434,13 +579,14 @@ class EtcherApp(tk.Tk):
             self.selected_device = None
             self._update_flash_button_state()
             return
-        index = int(selection[0])
-        self.selected_device = self.devices[index]
-        self.status_text.set(f"Ready to write to {self.selected_device.path}")
+        path = selection[0]
+        self.selected_device = next((d for d in self.devices if d.path == path), None)
+        if self.selected_device is not None:
+            self.status_text.set(f"Ready to write to {self.selected_device.path}")
         self._update_flash_button_state()
 
     def start_flash(self) -> None:
-        if self.flash_thread and self.flash_thread.is_alive():
+        if self._flash_active:
             return
 
         image_path = self.image_path.get().strip()
@@ -481,142 +627,209 @@ class EtcherApp(tk.Tk):
         if not confirm:
             return
 
+        # Size write requests for the bus the target sits on: large chunks
+        # keep NVMe/SATA/USB3 pipelines full, small ones spare slow media.
+        self.chunk_size = recommended_chunk_size(device.transport)
+
+        dry_run = self.dry_run_enabled.get()
+        job = {
+            "cmd": "flash",
+            "image": image_path,
+            "device": device.path,
+            "verify": self.verify_enabled.get(),
+            "dry_run": dry_run,
+            "chunk_size": self.chunk_size,
+        }
+        error_message = self._submit_worker_job(job, dry_run=dry_run)
+        if error_message:
+            messagebox.showerror("Error", error_message)
+            return
+
+        self._flash_active = True
         self._set_busy(True)
         self._reset_progress_bar()
         self.status_text.set("Launching write operation")
         self.log(f"Writing {Path(image_path).name} to {device.path}")
 
-        args = (
-            image_path,
-            device.path,
-            self.verify_enabled.get(),
-            self.dry_run_enabled.get(),
-        )
+    def _submit_worker_job(self, job: dict, *, dry_run: bool) -> Optional[str]:
+        """Send a job line to the worker, (re)spawning it if needed.
 
-        self.flash_thread = threading.Thread(
-            target=self._run_worker_process,
-            args=args,
-            daemon=True,
-        )
-        self.flash_thread.start()
+        Returns an error message on failure, None when the job is on its way.
+        """
+        needs_privileges = hasattr(os, "geteuid") and os.geteuid() != 0 and not dry_run
+        proc = self._worker_proc
+        if proc is not None and proc.poll() is None:
+            if needs_privileges and not self._worker_privileged:
+                # An unprivileged worker (from a dry run) cannot write to the
+                # device; trade it for an elevated one.
+                self._stop_worker()
+                proc = None
+        else:
+            proc = None
+
+        payload = json.dumps(job).encode("utf-8") + b"\n"
+        for attempt in range(2):
+            if proc is None:
+                error_message = self._spawn_worker(needs_privileges=needs_privileges)
+                if error_message:
+                    return error_message
+                proc = self._worker_proc
+            assert proc is not None and proc.stdin is not None
+            try:
+                proc.stdin.write(payload)
+                proc.stdin.flush()
+            except (OSError, ValueError):
+                # The worker died since the last job; retry once with a
+                # fresh one.
+                self._stop_worker()
+                proc = None
+                continue
+            return None
+        return "Failed to hand the job to the worker process."
 
-    def _run_worker_process(
-        self,
-        image_path: str,
-        device_path: str,
-        verify: bool,
-        dry_run: bool,
-    ) -> None:
-        command, error_message = self._build_worker_command(
-            image_path=image_path,
-            device_path=device_path,
-            verify=verify,
-            dry_run=dry_run,
-        )
+    def _spawn_worker(self, *, needs_privileges: bool) -> Optional[str]:
+        command, error_message = self._build_worker_command(needs_privileges=needs_privileges)
         if command is None:
-            self.event_queue.put(("error", error_message or "Missing pkexec to gain privileges."))
-            return
-
+            return error_message or "Missing pkexec to gain privileges."
         try:
             process = subprocess.Popen(
                 command,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                bufsize=65536,
                 cwd=str(self.project_root),
             )
         except Exception as exc:  # pragma: no cover - launch failure
-            self.event_queue.put(("error", f"Failed to launch privileged helper: {exc}"))
-            return
-
-        done = False
-        errored = False
-
-        def handle_event(event: dict) -> None:
-            nonlocal done, errored
-            kind = event.get("event")
-            if kind == "progress":
-                phase = event.get("phase")
-                current = int(event.get("current", 0))
-                total = event.get("total")
-                total_value = int(total) if isinstance(total, int) else None
-                if phase == "write":
-                    self.event_queue.put(("progress", current, total_value))
-                else:
-                    self.event_queue.put(("verify", current, total_value))
-            elif kind == "status":
-                message = event.get("message", "")
-                if message:
-                    self.event_queue.put(("status", message))
-            elif kind == "log":
-                message = event.get("message", "")
-                if message:
-                    self.event_queue.put(("log", message))
-            elif kind == "done":
-                done = True
-                written = int(event.get("bytes_written", 0))
-                dry = bool(event.get("dry_run", dry_run))
-                self.event_queue.put(("done", written, dry))
-            elif kind == "error":
-                errored = True
-                message = event.get("message", "Unknown error")
-                self.event_queue.put(("error", message))
-
-        assert process.stdout is not None
-        stdout_thread = threading.Thread(
-            target=self._read_worker_stdout,
-            args=(process.stdout, handle_event),
-            daemon=True,
-        )
-        stdout_thread.start()
-
-        assert process.stderr is not None
-        stderr_thread = threading.Thread(
-            target=self._read_worker_stderr,
-            args=(process.stderr,),
+            return f"Failed to launch privileged helper: {exc}"
+        self._worker_proc = process
+        self._worker_privileged = needs_privileges
+        threading.Thread(
+            target=self._read_worker_output,
+            args=(process,),
             daemon=True,
-        )
-        stderr_thread.start()
-
-        stdout_thread.join()
-        return_code = process.wait()
-        stderr_thread.join(timeout=0.1)
+        ).start()
+        return None
 
-        if not done and not errored and return_code != 0:
-            self.event_queue.put(("error", f"Worker exited with code {return_code}"))
-
-    def _read_worker_stdout(self, stream: TextIO, handler: Callable[[dict], None]) -> None:
-        for raw_line in stream:
-            line = raw_line.strip()
-            if not line:
-                continue
+    def _stop_worker(self) -> None:
+        proc, self._worker_proc = self._worker_proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            assert proc.stdin is not None
+            proc.stdin.write(b'{"cmd": "stop"}\n')
+            proc.stdin.flush()
+            proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
             try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                self.event_queue.put(("log", f"[worker] {line}"))
-                continue
-            handler(event)
-        stream.close()
-
-    def _read_worker_stderr(self, stream: TextIO) -> None:
-        for raw_line in stream:
-            line = raw_line.rstrip()
+                proc.terminate()
+            except OSError:
+                # A pkexec-elevated worker cannot be signalled from here.
+                pass
+
+    def _read_worker_output(self, process: subprocess.Popen) -> None:
+        """Drain both worker pipes from a single thread.
+
+        One selector loop over stdout and stderr replaces a blocking reader
+        thread per pipe; stdout bytes go through the incremental frame
+        parser, stderr is split into log lines.
+        """
+        assert process.stdout is not None and process.stderr is not None
+        parser = EventParser()
+        stderr_buffer = bytearray()
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+        try:
+            while selector.get_map():
+                for key, _mask in selector.select(timeout=0.2):
+                    data = os.read(key.fd, 65536)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                        continue
+                    if key.data == "stdout":
+                        for item in parser.feed(data):
+                            self._handle_worker_item(item)
+                    else:
+                        stderr_buffer += data
+                        while True:
+                            newline = stderr_buffer.find(b"\n")
+                            if newline < 0:
+                                break
+                            line = bytes(stderr_buffer[:newline]).decode("utf-8", "replace").rstrip()
+                            del stderr_buffer[:newline + 1]
+                            if line:
+                                self._queue_event(("log", f"[worker] {line}"))
+        finally:
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+        tail = bytes(stderr_buffer).decode("utf-8", "replace").rstrip()
+        if tail:
+            self._queue_event(("log", f"[worker] {tail}"))
+        self._queue_event(("worker_exit", process, process.wait()))
+
+    def _handle_worker_item(self, item: object) -> None:
+        if isinstance(item, tuple):
+            phase, current, total = item
+            self._post_progress(phase == PHASE_WRITE, current, total)
+            return
+        try:
+            event = _json_loads(item)
+        except ValueError:
+            line = item.decode("utf-8", "replace").strip()
             if line:
-                self.event_queue.put(("log", f"[worker] {line}"))
-        stream.close()
+                self._queue_event(("log", f"[worker] {line}"))
+            return
+        handler = self._EVENT_HANDLERS.get(event.get("event"))
+        if handler is not None:
+            handler(self, event)
+
+    def _on_progress_event(self, event: dict) -> None:
+        current = int(event.get("current", 0))
+        total = event.get("total")
+        total_value = int(total) if isinstance(total, int) else None
+        self._post_progress(event.get("phase") == "write", current, total_value)
+
+    def _on_status_event(self, event: dict) -> None:
+        message = event.get("message", "")
+        if message:
+            self._queue_event(("status", message))
+
+    def _on_log_event(self, event: dict) -> None:
+        message = event.get("message", "")
+        if message:
+            self._queue_event(("log", message))
+
+    def _on_done_event(self, event: dict) -> None:
+        written = int(event.get("bytes_written", 0))
+        dry = bool(event.get("dry_run", False))
+        self._queue_event(("done", written, dry))
+
+    def _on_error_event(self, event: dict) -> None:
+        self._queue_event(("error", event.get("message", "Unknown error")))
+
+    # Worker-event dispatch: one dict lookup replaces the kind if/elif chain.
+    _EVENT_HANDLERS = {
+        "progress": _on_progress_event,
+        "status": _on_status_event,
+        "log": _on_log_event,
+        "done": _on_done_event,
+        "error": _on_error_event,
+    }
 
     def _build_worker_command(
         self,
         *,
-        image_path: str,
-        device_path: str,
-        verify: bool,
-        dry_run: bool,
+        needs_privileges: bool,
     ) -> tuple[Optional[list[str]], Optional[str]]:
         python_executable = sys.executable or "python3"
         command: list[str] = []
 
-        needs_privileges = hasattr(os, "geteuid") and os.geteuid() != 0 and not dry_run
         if needs_privileges:
             pkexec_path = shutil.which("pkexec")
             if not pkexec_path:
@@ -624,83 +837,135 @@ class EtcherApp(tk.Tk):
             command.append(pkexec_path)
 
         entrypoint = str(self.project_root / "shark_etcher" / "__main__.py")
-
         command.extend(
             [
                 python_executable,
                 entrypoint,
                 "--worker",
-                "--image",
-                image_path,
-                "--device",
-                device_path,
-                "--chunk-size",
-                str(self.chunk_size),
+                "--serve",
+                "--progress-binary",
             ]
         )
-
-        if verify:
-            command.append("--verify")
-        if dry_run:
-            command.append("--dry-run")
-
         return command, None
 
-    def _poll_events(self) -> None:
+    def _queue_event(self, event: tuple) -> None:
+        """Enqueue an event from a worker thread and wake the UI thread."""
+        self.event_queue.put(event)
+        self._wake_ui()
+
+    def _post_progress(self, is_write: bool, current: int, total: Optional[int]) -> None:
+        """Overwrite the pending progress slot from a worker thread."""
+        with self._progress_lock:
+            if is_write:
+                self._latest_progress = (current, total)
+            else:
+                self._latest_verify = (current, total)
+        self._wake_ui()
+
+    def _wake_ui(self) -> None:
+        try:
+            self.event_generate("<<WorkerEvent>>", when="tail")
+        except tk.TclError:
+            # The window is being torn down; the safety-net timer (or nobody)
+            # will drain the queue.
+            pass
+
+    def _drain_queue(self) -> int:
+        drained = 0
+        with self._progress_lock:
+            progress, self._latest_progress = self._latest_progress, None
+            verify, self._latest_verify = self._latest_verify, None
+        if progress is not None:
+            self._handle_progress(*progress)
+            drained += 1
+        if verify is not None:
+            self._handle_verify(*verify)
+            drained += 1
+        pending_logs: list[str] = []
         try:
             while True:
                 event = self.event_queue.get_nowait()
+                drained += 1
                 kind = event[0]
-                if kind == "progress":
-                    self._handle_progress(event[1], event[2])
-                elif kind == "verify":
-                    self._handle_verify(event[1], event[2])
-                elif kind == "status":
+                if kind == "status":
                     message = event[1]
                     self.status_text.set(message)
-                    self.log(message)
+                    pending_logs.append(message)
                 elif kind == "done":
                     written, dry_run = event[1], event[2]
                     self._flash_completed(written, dry_run)
                 elif kind == "error":
                     self._flash_failed(event[1])
                 elif kind == "log":
-                    self.log(event[1])
+                    pending_logs.append(event[1])
+                elif kind == "devices":
+                    self._apply_device_list(event[1])
+                elif kind == "devices_error":
+                    self._refresh_finished()
+                    messagebox.showerror("Error", event[1])
+                elif kind == "worker_exit":
+                    if event[1] is self._worker_proc:
+                        self._worker_proc = None
+                        if self._flash_active:
+                            self._flash_failed(f"Worker exited with code {event[2]}")
         except queue.Empty:
             pass
-        finally:
-            self.after(100, self._poll_events)
+        if pending_logs:
+            self._append_log_lines(pending_logs)
+        return drained
+
+    def _poll_events(self) -> None:
+        drained = self._drain_queue()
+        self.after(POLL_BUSY_MS if drained else POLL_IDLE_MS, self._poll_events)
+
+    def _set_progress_mode(self, mode: str) -> None:
+        """Switch the bar mode; tracked locally so no Tcl query per event."""
+        if self._progress_mode == mode:
+            return
+        if mode == "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode=mode)
+        else:
+            self.progress_bar.configure(mode=mode)
+            self.progress_bar.start(60)
+        self._progress_mode = mode
+
+    def _set_status_throttled(self, message: str, *, force: bool = False) -> None:
+        """Rewrite the status label at most ~10 times per second.
+
+        The final update of a phase passes ``force`` so a finished transfer
+        never shows a stale percentage.
+        """
+        now = time.monotonic()
+        if force or now - self._last_status_ts >= STATUS_INTERVAL:
+            self._last_status_ts = now
+            self.status_text.set(message)
 
     def _handle_progress(self, written: int, total: Optional[int]) -> None:
         self.progress_total = total
         if total is not None and total > 0:
             percent = min(100.0, (written / total) * 100.0)
-            if str(self.progress_bar["mode"]) != "determinate":
-                self.progress_bar.stop()
-                self.progress_bar.configure(mode="determinate")
+            self._set_progress_mode("determinate")
             self.progress_bar.configure(value=percent)
-            self.status_text.set(f"Writing: {percent:.1f}%")
+            self._set_status_throttled(f"Writing: {percent:.1f}%", force=percent >= 100.0)
         else:
-            if str(self.progress_bar["mode"]) != "indeterminate":
-                self.progress_bar.configure(mode="indeterminate")
-                self.progress_bar.start(60)
-            self.status_text.set(f"Written {written} bytes")
+            self._set_progress_mode("indeterminate")
+            self._set_status_throttled(f"Written {written} bytes")
 
     def _handle_verify(self, checked: int, total: Optional[int]) -> None:
-        if str(self.progress_bar["mode"]) != "determinate":
-            self.progress_bar.stop()
-            self.progress_bar.configure(mode="determinate")
+        self._set_progress_mode("determinate")
         if total is not None and total > 0:
             percent = min(100.0, (checked / total) * 100.0)
             self.progress_bar.configure(value=percent)
-            self.status_text.set(f"Verifying: {percent:.1f}%")
+            self._set_status_throttled(f"Verifying: {percent:.1f}%", force=percent >= 100.0)
         else:
-            self.status_text.set(f"Verifying: {checked} bytes")
+            self._set_status_throttled(f"Verifying: {checked} bytes")
 
     def _flash_completed(self, written: int, dry_run: bool) -> None:
+        self._flash_active = False
         self._set_busy(False)
-        self.progress_bar.stop()
-        self.progress_bar.configure(mode="determinate", value=100)
+        self._set_progress_mode("determinate")
+        self.progress_bar.configure(value=100)
         if dry_run:
             message = "Dry run completed; no data was written."
         else:
@@ -711,67 +976,72 @@ class EtcherApp(tk.Tk):
         self.after(500, self.refresh_devices)
 
     def _flash_failed(self, error_message: str) -> None:
+        self._flash_active = False
         self._set_busy(False)
-        self.progress_bar.stop()
-        self.progress_bar.configure(mode="determinate", value=0)
+        self._set_progress_mode("determinate")
+        self.progress_bar.configure(value=0)
         self.status_text.set("Write failed")
         self.log(f"Error: {error_message}")
         messagebox.showerror("Error", error_message)
 
     def _set_busy(self, busy: bool) -> None:
-        state = tk.DISABLED if busy else tk.NORMAL
+        # Every busy-sensitive widget is ttk, so the shared state-flag API
+        # covers the lot — Treeview included — without per-class casing.
+        spec = ["disabled"] if busy else ["!disabled"]
         for widget in self._busy_widgets:
-            if isinstance(widget, ttk.Treeview):
-                if busy:
-                    widget.state(["disabled"])
-                else:
-                    widget.state(["!disabled"])
-                continue
-            try:
-                widget.configure(state=state)
-            except tk.TclError:
-                # Some widgets (e.g. custom ones) may not expose a configurable state
-                continue
+            widget.state(spec)
         if busy:
-            self.progress_bar.configure(mode="determinate", value=0)
+            self._set_progress_mode("determinate")
+            self.progress_bar.configure(value=0)
         else:
             self._update_flash_button_state()
 
     def _reset_progress_bar(self) -> None:
-        self.progress_bar.stop()
-        self.progress_bar.configure(mode="determinate", value=0)
+        self._set_progress_mode("determinate")
+        self.progress_bar.configure(value=0)
 
     def _update_flash_button_state(self) -> None:
         image_selected = bool(self.image_path.get().strip())
         device_selected = self.selected_device is not None
-        if self.flash_thread and self.flash_thread.is_alive():
-            state = tk.DISABLED
-        elif image_selected and device_selected:
-            state = tk.NORMAL
+        if self._flash_active:
+            enabled = False
         else:
-            state = tk.DISABLED
-        self.flash_btn.configure(state=state)
+            enabled = image_selected and device_selected
+        self.flash_btn.state(["!disabled"] if enabled else ["disabled"])
 
     def destroy(self) -> None:
-        if self.flash_thread and self.flash_thread.is_alive():
+        if self._flash_active:
             messagebox.showwarning(
                 "Write in progress",
                 "Wait for the write operation to finish before closing.",
             )
             return
+        self._stop_worker()
         super().destroy()
 
 
+# Characters that end a bare Tcl word or trigger substitution; anything else
+# can simply be brace-quoted.
+_TCL_SPECIALS = re.compile(r'([\s\\{}\[\]$";])')
+
+
+def _tcl_escape(value: str) -> str:
+    """Quote *value* so Tcl treats it as one literal word."""
+    if not value:
+        return "{}"
+    if "{" not in value and "}" not in value and "\\" not in value:
+        return "{" + value + "}"
+    return _TCL_SPECIALS.sub(r"\\\1", value)
+
+
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
 def _format_size(size_bytes: int) -> str:
     if size_bytes <= 0:
         return "0 B"
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
-    value = float(size_bytes)
-    for unit in units:
-        if value < 1024.0:
-            break
-        value /= 1024.0
-    return f"{value:.1f} {unit}"
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def run_gui() -> None: